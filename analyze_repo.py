@@ -1,4 +1,17 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# Shared session so every API call reuses pooled connections to api.github.com
+# instead of paying a new TCP+TLS handshake per directory
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Conditional request cache: {url: (etag, contents)}
+# GitHub answers a matching If-None-Match with 304 Not Modified
+ETAG_CACHE = {}
 
 
 def fetch_contents(repo_owner, repo_name, path=''):
@@ -7,21 +20,52 @@ def fetch_contents(repo_owner, repo_name, path=''):
         'Accept': 'application/vnd.github.v3+json',
         # 'Authorization': 'token YOUR_GITHUB_TOKEN'  # Uncomment and add your GitHub token if needed
     }
-    response = requests.get(url, headers=headers)
+    cached = ETAG_CACHE.get(url)
+    if cached:
+        headers['If-None-Match'] = cached[0]
+
+    response = SESSION.get(url, headers=headers)
+    if cached and response.status_code == 304:
+        return cached[1]
     response.raise_for_status()
-    return response.json()
+
+    contents = response.json()
+    etag = response.headers.get('ETag')
+    if etag:
+        ETAG_CACHE[url] = (etag, contents)
+    return contents
+
+
+def fetch_tree(repo_owner, repo_name, contents, max_workers=8):
+    # Each listing is one API round trip, so fetch subdirectories concurrently,
+    # submitting children as soon as their parent listing arrives.
+    # Returns {dir_path: contents} for every directory below `contents`.
+    listings = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit_dirs(items):
+            return {executor.submit(fetch_contents, repo_owner, repo_name, item['path']): item['path']
+                    for item in items if item['type'] == 'dir'}
+
+        pending = submit_dirs(contents)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                listings[path] = future.result()
+                pending.update(submit_dirs(listings[path]))
+    return listings
 
 
-def print_structure(contents, indent=0):
+def print_structure(contents, listings, indent=0):
     for item in contents:
         print('  ' * indent + item['name'])
         if item['type'] == 'dir':
-            sub_contents = fetch_contents(repo_owner, repo_name, item['path'])
-            print_structure(sub_contents, indent + 1)
+            print_structure(listings[item['path']], listings, indent + 1)
 
 
 if __name__ == "__main__":
     repo_owner = "jackccrawford"
     repo_name = "nvidia-gpu-perf-monitor"
     contents = fetch_contents(repo_owner, repo_name)
-    print_structure(contents)
+    listings = fetch_tree(repo_owner, repo_name, contents)
+    print_structure(contents, listings)
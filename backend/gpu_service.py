@@ -4,10 +4,13 @@
 NVIDIA GPU Monitoring Service
 
 This Flask-based service provides real-time GPU metrics through a RESTful API.
-It monitors NVIDIA GPUs using the nvidia-smi tool and exposes the following endpoints:
+It monitors NVIDIA GPUs through the NVML library (via the pynvml bindings),
+falling back to nvidia-smi (a persistent dmon stream plus periodic XML
+reports) when NVML is unavailable, and
+exposes the following endpoints:
 
 Endpoints:
-    GET /api/gpu-stats - Returns current GPU statistics including:
+    GET /api/gpu-stats - Returns the latest background-sampled GPU statistics including:
         - Temperature, fan speed, and utilization metrics
         - Memory usage and power consumption
         - Process information for each GPU
@@ -15,6 +18,9 @@ Endpoints:
         - Peak temperature records
         - GPU burn test metrics (if applicable)
 
+    GET /api/gpu-stats/stream - Server-Sent Events stream of the same statistics,
+        sampled once in a background thread and pushed to every connected client
+
     POST /api/reset-peaks - Resets the recorded peak temperatures
 
 Security:
@@ -22,20 +28,24 @@ Security:
     - No authentication required (intended for local network use only)
 
 Dependencies:
-    - nvidia-smi command-line tool
-    - NVIDIA drivers properly installed
+    - NVIDIA drivers properly installed (provides libnvidia-ml)
+    - nvidia-ml-py package (pynvml bindings)
+    - nvidia-smi command-line tool (fallback when NVML is unavailable)
     - Flask and flask-cors packages
+    - numpy package
+    - orjson package (optional, faster JSON responses)
+    - flask-compress package (optional, brotli/gzip compressed responses)
 
 Data Structures:
     temperature_history : dict
         Keys: GPU index (int)
-        Values: deque of (timestamp, temperature) tuples
+        Values: TempRing of (timestamp, temperature) samples
         Purpose: Tracks temperature changes over time for trend analysis
         Max Length: 40 entries (10 seconds at 250ms intervals)
 
-    peak_temperatures : dict
-        Keys: GPU index (int)
-        Values: highest recorded temperature (float)
+    peak_temperatures : numpy.ndarray
+        Index: GPU index (int)
+        Values: highest recorded temperature (float64, -inf until first sample)
         Purpose: Maintains high-water marks for each GPU
         Reset: Via /api/reset-peaks endpoint
 
@@ -43,75 +53,569 @@ Data Structures:
         Keys: 'start_time', 'errors_detected', 'total_time'
         Purpose: Tracks GPU stress test metrics
         Reset: Errors reset via /api/reset-peaks endpoint
+
+    static_gpu_info : dict
+        Keys: GPU index (int)
+        Values: dict of 'name', 'uuid', 'memory_total', 'power_limit', 'compute_mode'
+        Purpose: Caches per-GPU fields that do not change between polls
+                 (power limit / compute mode changes need a service restart)
+
+    latest_snapshot : dict or None
+        Purpose: Most recent parse_gpu_info() result, replaced (never mutated)
+                 by the background sampler every SAMPLE_INTERVAL seconds
+
+    nvidia_info_cache : dict or None
+        Keys: 'driver_version', 'cuda_version'
+        Purpose: Caches the static driver/CUDA versions after the first lookup
 """
 
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import subprocess
 import json
+import logging
+import queue
 import re
-from collections import deque
-from datetime import datetime
+import xml.etree.ElementTree as ET
 import threading
 import time
+import numpy as np
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson serializes the GPU snapshot several times faster than the stdlib
+    json module and produces bytes directly, so jsonify() responses skip the
+    intermediate str. Unsupported types still go through Flask's default hook.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 CORS(app)
 
+# Compress JSON responses: the snapshot repeats the same keys for every GPU
+# and process. Brotli is preferred where the client accepts it (browsers only
+# offer it over HTTPS), gzip otherwise. Only the default text/JSON mimetypes
+# are compressed, so the text/event-stream endpoint is left untouched.
+if Compress is not None:
+    app.config.update(
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_BR_LEVEL=4,
+        COMPRESS_MIN_SIZE=256,
+    )
+    Compress(app)
+
+logger = logging.getLogger(__name__)
+
+MIB = 1024 * 1024
+
+# Driver version line in /proc/driver/nvidia/version, matched on the raw bytes
+DRIVER_VERSION_RE = re.compile(rb'Kernel Module.*?\s(\d+\.\d+(?:\.\d+)?)\s')
+
+# gpu-burn stress test process names, matched case-insensitively
+GPU_BURN_RE = re.compile(r'gpu-burn', re.IGNORECASE)
+
+# NVML compute mode constants (NVML_COMPUTEMODE_*) mapped to the names nvidia-smi prints
+COMPUTE_MODES = {
+    0: 'Default',
+    1: 'Exclusive_Thread',
+    2: 'Prohibited',
+    3: 'Exclusive_Process',
+}
+
+# NVML is initialized once at import; device handles are stable for the
+# lifetime of the process, so they are looked up once and reused on every poll.
+# When NVML is unavailable, metrics are read from a single `nvidia-smi -q -x` call instead.
+nvml_handles = []
+nvml_init_error = None
+if pynvml is None:
+    nvml_init_error = "pynvml is not installed"
+else:
+    try:
+        pynvml.nvmlInit()
+        nvml_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+    except pynvml.NVMLError as e:
+        nvml_init_error = str(e)
+if nvml_init_error is not None:
+    logger.warning("NVML unavailable (%s), falling back to nvidia-smi", nvml_init_error)
+
+# Interval between background samples served by /api/gpu-stats and the stream (seconds)
+SAMPLE_INTERVAL = 0.25
+
+# How long the first /api/gpu-stats request waits for the sampler's first snapshot (seconds)
+FIRST_SNAPSHOT_TIMEOUT = 5
+
+# Comment frame sent to idle stream clients so proxies keep the connection open (seconds)
+HEARTBEAT_INTERVAL = 15
+
+# How often the nvidia-smi XML report (names, limits, fan speed, processes) is
+# refreshed while `nvidia-smi dmon` streams the per-second metrics (seconds)
+SMI_REPORT_INTERVAL = 5
+
 # Temperature history for each GPU
-# Format: {gpu_index: deque([(timestamp, temp), ...], maxlen=40)}
+# Format: {gpu_index: TempRing(capacity=40)}
 temperature_history = {}
 
 # Peak temperature tracking
-# Format: {gpu_index: highest_recorded_temperature}
-peak_temperatures = {}
+# Format: array indexed by GPU index holding the highest recorded temperature;
+# -inf marks GPUs with no sample since startup or the last reset
+peak_temperatures = np.empty(0, dtype=np.float64)
 
 # GPU burn test metrics
-# Format: {start_time: float, errors_detected: int, total_time: float}
+# Format: {start_time: float (time.monotonic()), errors_detected: int, total_time: float}
 gpu_burn_metrics = {
     'start_time': None,
     'errors_detected': 0,
     'total_time': 0
 }
 
-def get_nvidia_info():
+# Per-GPU fields that do not change between polls, filled on first sight
+# Format: {gpu_index: {name, uuid, memory_total, power_limit, compute_mode}}
+static_gpu_info = {}
+
+# Guards temperature_history, peak_temperatures and gpu_burn_metrics, which are
+# updated by the background sampler and cleared by /api/reset-peaks
+state_lock = threading.Lock()
+
+# Most recent parse_gpu_info() result published by the background sampler
+latest_snapshot = None
+snapshot_lock = threading.Lock()
+snapshot_ready = threading.Event()
+
+# Per-client queues fed by the background sampler
+# Format: {queue.Queue(maxsize=1), ...}
+stream_subscribers = set()
+stream_lock = threading.Lock()
+sampler_thread = None
+
+# nvidia-smi fallback state, used only when NVML is unavailable
+# dmon_stream: DmonStream supplying per-second metrics
+# smi_report: (nvidia_info, gpus, processes) from the last XML report
+dmon_stream = None
+smi_report = None
+smi_report_time = 0
+
+class TempRing:
+    """
+    Fixed-capacity ring buffer of (timestamp, temperature) samples for one GPU.
+
+    Timestamps and temperatures live in two parallel float64 arrays rather
+    than a deque of tuples, so appending a sample writes two array slots
+    instead of allocating a tuple and two float objects. Samples are kept in
+    time order, with the oldest at index (i - n) % capacity.
+    """
+
+    __slots__ = ('t', 'v', 'i', 'n')
+
+    def __init__(self, capacity=40):
+        self.t = np.empty(capacity, dtype=np.float64)
+        self.v = np.empty(capacity, dtype=np.float64)
+        self.i = 0  # Slot the next sample is written to
+        self.n = 0  # Number of valid samples
+
+    def __len__(self):
+        return self.n
+
+    def append(self, timestamp, temperature):
+        """Stores a sample, overwriting the oldest one when full."""
+        self.t[self.i] = timestamp
+        self.v[self.i] = temperature
+        self.i = (self.i + 1) % len(self.t)
+        if self.n < len(self.t):
+            self.n += 1
+
+    def drop_before(self, cutoff):
+        """Discards samples older than cutoff, always keeping the newest one."""
+        capacity = len(self.t)
+        while self.n > 1 and self.t[(self.i - self.n) % capacity] < cutoff:
+            self.n -= 1
+
+    def oldest(self):
+        """Returns the temperature of the oldest retained sample."""
+        return float(self.v[(self.i - self.n) % len(self.v)])
+
+    def newest(self):
+        """Returns the temperature of the most recent sample."""
+        return float(self.v[(self.i - 1) % len(self.v)])
+
+def _read_proc_driver_version():
+    """
+    Reads the driver version exported by the NVIDIA kernel module.
+
+    /proc/driver/nvidia/version contains a line such as
+    "NVRM version: NVIDIA UNIX x86_64 Kernel Module  535.183.01  ..." which
+    is far cheaper to read than starting nvidia-smi.
+
+    Returns:
+        str: Driver version, or None if the file is missing or unrecognized
+    """
+    try:
+        with open('/proc/driver/nvidia/version', 'rb') as f:
+            match = DRIVER_VERSION_RE.search(f.read())
+    except OSError:
+        return None
+    return match.group(1).decode() if match else None
+
+def query_smi_xml():
+    """
+    Runs `nvidia-smi -q -x` once and parses its XML report.
+
+    The XML report carries the driver/CUDA versions, every per-GPU metric and
+    the process list, so a single subprocess replaces the separate driver,
+    GPU and process queries.
+
+    Returns:
+        Element: Root <nvidia_smi_log> element
+    """
+    result = subprocess.run(['nvidia-smi', '-q', '-x'], capture_output=True, check=True)
+    return ET.fromstring(result.stdout)
+
+# Driver and CUDA versions cannot change while the service is running, so
+# they are looked up once and reused for every request
+# Format: {driver_version: str, cuda_version: str}
+nvidia_info_cache = None
+
+def get_nvidia_info(smi_log=None):
     """
     Retrieves NVIDIA driver and CUDA version information.
 
-    Uses nvidia-smi to query the system for driver and CUDA versions.
+    Queries NVML for the driver and CUDA versions. When NVML could not be
+    initialized, the driver version is read from /proc/driver/nvidia/version
+    and the remaining fields come from the nvidia-smi XML report. The result
+    is computed once and cached in the module-level nvidia_info_cache; failed
+    lookups are not cached so they are retried on the next request.
     Handles potential errors gracefully by returning "Unknown" for missing information.
 
+    Args:
+        smi_log (Element, optional): Already-parsed nvidia-smi XML report to
+            reuse instead of running nvidia-smi again
+
     Returns:
         dict: A dictionary containing:
             - driver_version (str): NVIDIA driver version (e.g., "535.183.01")
             - cuda_version (str): CUDA version (e.g., "12.2")
                                 Returns "Unknown" if information cannot be retrieved
     """
-    try:
-        # Get NVIDIA driver version
-        driver_cmd = subprocess.run(['nvidia-smi', '--query-gpu=driver_version', '--format=csv,noheader,nounits'], 
-                                  capture_output=True, text=True)
-        driver_version = driver_cmd.stdout.strip() if driver_cmd.stdout else "Unknown"
-
-        # Get CUDA version from the main nvidia-smi output
-        cuda_cmd = subprocess.run(['nvidia-smi'], capture_output=True, text=True)
-        cuda_version = "Unknown"
-        if cuda_cmd.stdout:
-            match = re.search(r'CUDA Version: ([\d\.]+)', cuda_cmd.stdout)
-            if match:
-                cuda_version = match.group(1)
+    global nvidia_info_cache
+    if nvidia_info_cache is not None:
+        return nvidia_info_cache
 
-        return {
-            'driver_version': driver_version.split('\n')[0] if '\n' in driver_version else driver_version,
+    try:
+        if nvml_init_error is None:
+            driver_version = _nvml_str(pynvml.nvmlSystemGetDriverVersion())
+            # NVML encodes the CUDA version as 1000 * major + 10 * minor (e.g. 12020)
+            cuda = pynvml.nvmlSystemGetCudaDriverVersion()
+            cuda_version = f"{cuda // 1000}.{(cuda % 1000) // 10}"
+        else:
+            if smi_log is None:
+                smi_log = query_smi_xml()
+            # Prefer the kernel module's proc entry for the driver version
+            driver_version = _read_proc_driver_version() or smi_log.findtext('driver_version', 'Unknown')
+            cuda_version = smi_log.findtext('cuda_version', 'Unknown')
+
+        nvidia_info_cache = {
+            'driver_version': driver_version,
             'cuda_version': cuda_version
         }
+        return nvidia_info_cache
     except Exception as e:
-        print(f"Error getting NVIDIA info: {str(e)}")
+        logger.error("Error getting NVIDIA info: %s", e)
         return {
             'driver_version': "Unknown",
             'cuda_version': "Unknown"
         }
 
+def _nvml_str(value):
+    """
+    Normalizes an NVML string result.
+
+    Older pynvml releases return bytes, newer ones return str.
+    """
+    return value.decode() if isinstance(value, bytes) else value
+
+def _nvml_optional(getter, handle, default=0):
+    """
+    Calls an NVML device getter, returning a default for unsupported queries.
+
+    Some boards (e.g. passively cooled datacenter GPUs) do not expose fan
+    speed or power readings; nvidia-smi prints "[N/A]" for these.
+    """
+    try:
+        return getter(handle)
+    except pynvml.NVMLError_NotSupported:
+        return default
+
+def read_nvml_devices():
+    """
+    Reads raw GPU metrics and compute processes from NVML.
+
+    Returns:
+        tuple: (gpus, processes) where gpus is a list of per-GPU metric dicts
+               and processes is a list of compute process dicts
+    """
+    gpus = []
+    processes = []
+
+    for gpu_index, handle in enumerate(nvml_handles):
+        # NVML reports memory in bytes and power in milliwatts; the frontend
+        # expects the same MiB / W units nvidia-smi prints
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle, version=pynvml.nvmlMemory_v2)
+        utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+
+        # Name, UUID, memory size, power limit and compute mode do not change
+        # between polls; query them on first sight and reuse them afterwards
+        static = static_gpu_info.get(gpu_index)
+        if static is None:
+            static = static_gpu_info[gpu_index] = {
+                'name': _nvml_str(pynvml.nvmlDeviceGetName(handle)),
+                'uuid': _nvml_str(pynvml.nvmlDeviceGetUUID(handle)),
+                'memory_total': memory.total / MIB,
+                'power_limit': _nvml_optional(pynvml.nvmlDeviceGetPowerManagementLimit, handle) / 1000.0,
+                'compute_mode': COMPUTE_MODES.get(pynvml.nvmlDeviceGetComputeMode(handle), 'Unknown')
+            }
+
+        gpus.append({
+            'index': gpu_index,
+            'name': static['name'],
+            'fan_speed': float(_nvml_optional(pynvml.nvmlDeviceGetFanSpeed, handle)),
+            'power_draw': _nvml_optional(pynvml.nvmlDeviceGetPowerUsage, handle) / 1000.0,
+            'power_limit': static['power_limit'],
+            'memory_total': static['memory_total'],
+            'memory_used': memory.used / MIB,
+            'gpu_utilization': float(utilization.gpu),
+            'temperature': float(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)),
+            'compute_mode': static['compute_mode']
+        })
+
+        gpu_uuid = static['uuid']
+        for proc in pynvml.nvmlDeviceGetComputeRunningProcesses_v3(handle):
+            try:
+                name = _nvml_str(pynvml.nvmlSystemGetProcessName(proc.pid))
+            except pynvml.NVMLError:
+                # Process exited between the two NVML calls
+                continue
+
+            # usedGpuMemory is None when the driver cannot attribute memory (e.g. under WDDM/MIG)
+            used_memory = proc.usedGpuMemory / MIB if proc.usedGpuMemory is not None else 0.0
+
+            processes.append({
+                'gpu_uuid': gpu_uuid,
+                'pid': proc.pid,
+                'used_memory': used_memory,
+                'name': name
+            })
+
+    return gpus, processes
+
+def _smi_float(element, *tags, default=0.0):
+    """
+    Reads the first available numeric value from an nvidia-smi XML element.
+
+    Values carry a unit suffix ("45 C", "1024 MiB", "120.50 W") and are
+    "N/A" or "[N/A]" when unsupported. Several tags may be given because
+    element names differ between driver releases. Only direct child tags are
+    accepted: simple-tag lookups run entirely inside the C ElementTree
+    accelerator, whereas "a/b" paths are evaluated by the Python ElementPath
+    engine on every call.
+    """
+    if element is None:
+        return default
+    for tag in tags:
+        text = element.findtext(tag)
+        if text:
+            try:
+                return float(text.partition(' ')[0])
+            except ValueError:
+                continue
+    return default
+
+class DmonStream:
+    """
+    Long-running `nvidia-smi dmon` process used when NVML is unavailable.
+
+    dmon prints one line per GPU every second, so new samples cost a read
+    from a pipe instead of a fork+exec of nvidia-smi. A daemon thread parses
+    each line and keeps the latest power, temperature, SM utilization and
+    framebuffer usage per GPU. Columns are located from dmon's header line
+    because the set of columns differs between driver releases.
+    """
+
+    # dmon column name -> GPU metric field
+    FIELDS = {
+        'pwr': 'power_draw',
+        'gtemp': 'temperature',
+        'sm': 'gpu_utilization',
+        'fb': 'memory_used',
+    }
+
+    def __init__(self):
+        # Format: {gpu_index: {field: value, ...}}
+        self.latest = {}
+        self.process = subprocess.Popen(
+            ['nvidia-smi', 'dmon', '-s', 'pucvmet', '-d', '1', '-o', 'T'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self.thread = threading.Thread(target=self._read, name='nvidia-smi-dmon', daemon=True)
+        self.thread.start()
+
+    def alive(self):
+        """Returns True while the dmon process is still running."""
+        return self.process.poll() is None
+
+    def _read(self):
+        columns = {}
+        for line in self.process.stdout:
+            values = line.split()
+            if not values:
+                continue
+            if values[0].startswith('#'):
+                # Header lines: "#Time gpu pwr gtemp ..." followed by a units line
+                names = line.lstrip('#').split()
+                if 'gpu' in names:
+                    columns = {name: pos for pos, name in enumerate(names)}
+                continue
+            if 'gpu' not in columns or len(values) != len(columns):
+                continue
+
+            metrics = {}
+            for column, field in self.FIELDS.items():
+                pos = columns.get(column)
+                if pos is None:
+                    continue
+                try:
+                    metrics[field] = float(values[pos])
+                except ValueError:
+                    # "-" marks metrics the GPU does not report
+                    pass
+            self.latest[int(values[columns['gpu']])] = metrics
+
+    def overlay(self, gpus):
+        """Replaces dynamic metrics in GPU records with the latest dmon values."""
+        for gpu_data in gpus:
+            gpu_data.update(self.latest.get(gpu_data['index'], {}))
+
+def read_smi_devices(smi_log):
+    """
+    Reads raw GPU metrics and compute processes from an nvidia-smi XML report.
+
+    Args:
+        smi_log (Element): Root element returned by query_smi_xml()
+
+    Returns:
+        tuple: (gpus, processes) in the same format as read_nvml_devices()
+    """
+    gpus = []
+    processes = []
+
+    # nvidia-smi lists GPUs in index order
+    for gpu_index, gpu in enumerate(smi_log.findall('gpu')):
+        # Resolve each section once, then read its fields by direct child tag
+        memory = gpu.find('fb_memory_usage')
+        power = gpu.find('gpu_power_readings')
+        if power is None:
+            # Drivers before 530 name this section power_readings
+            power = gpu.find('power_readings')
+
+        # Static fields are only parsed the first time a GPU is seen
+        static = static_gpu_info.get(gpu_index)
+        if static is None:
+            static = static_gpu_info[gpu_index] = {
+                'name': gpu.findtext('product_name', '').strip(),
+                'uuid': gpu.findtext('uuid', ''),
+                'memory_total': _smi_float(memory, 'total'),
+                'power_limit': _smi_float(power, 'current_power_limit', 'power_limit'),
+                'compute_mode': gpu.findtext('compute_mode', 'Unknown')
+            }
+
+        gpus.append({
+            'index': gpu_index,
+            'name': static['name'],
+            'fan_speed': _smi_float(gpu, 'fan_speed'),
+            'power_draw': _smi_float(power, 'power_draw', 'instant_power_draw'),
+            'power_limit': static['power_limit'],
+            'memory_total': static['memory_total'],
+            'memory_used': _smi_float(memory, 'used'),
+            'gpu_utilization': _smi_float(gpu.find('utilization'), 'gpu_util'),
+            'temperature': _smi_float(gpu.find('temperature'), 'gpu_temp'),
+            'compute_mode': static['compute_mode']
+        })
+
+        gpu_uuid = static['uuid']
+        gpu_processes = gpu.find('processes')
+        if gpu_processes is None:
+            continue
+        for proc in gpu_processes.findall('process_info'):
+            # Match the NVML path, which only reports compute ("C" / "C+G") processes
+            if 'C' not in proc.findtext('type', ''):
+                continue
+            processes.append({
+                'gpu_uuid': gpu_uuid,
+                'pid': int(proc.findtext('pid')),
+                'used_memory': _smi_float(proc, 'used_memory'),
+                'name': proc.findtext('process_name', '')
+            })
+
+    return gpus, processes
+
+def read_smi_fallback():
+    """
+    Reads GPU information through nvidia-smi when NVML is unavailable.
+
+    Starts a persistent `nvidia-smi dmon` stream on first use. While it is
+    running, the full XML report is only re-read every SMI_REPORT_INTERVAL
+    seconds and dmon supplies the fast-changing power, temperature,
+    utilization and memory readings in between. If dmon exits, the XML
+    report is re-read on every call.
+
+    Returns:
+        tuple: (nvidia_info, gpus, processes)
+    """
+    global dmon_stream, smi_report, smi_report_time
+
+    if dmon_stream is None:
+        dmon_stream = DmonStream()
+    streaming = dmon_stream.alive()
+
+    now = time.monotonic()
+    if smi_report is None or not streaming or now - smi_report_time >= SMI_REPORT_INTERVAL:
+        smi_log = query_smi_xml()
+        smi_report = (get_nvidia_info(smi_log),) + read_smi_devices(smi_log)
+        smi_report_time = now
+
+    nvidia_info, gpus, processes = smi_report
+    # parse_gpu_info() adds fields to the GPU records, so hand out copies
+    gpus = [dict(gpu_data) for gpu_data in gpus]
+    if streaming:
+        dmon_stream.overlay(gpus)
+    return nvidia_info, gpus, processes
+
 def parse_gpu_info():
     """
     Collects and processes comprehensive GPU information.
@@ -119,6 +623,8 @@ def parse_gpu_info():
     This function:
     1. Retrieves driver/CUDA versions
     2. Collects detailed GPU metrics (temperature, memory, utilization, etc.)
+       from NVML, or from nvidia-smi (dmon stream plus periodic XML report)
+       when NVML is unavailable
     3. Updates temperature history and peak records
     4. Calculates temperature change rates
     5. Formats data for frontend consumption
@@ -142,118 +648,59 @@ def parse_gpu_info():
             - gpu_burn_metrics: Stress test metrics
             - success: Boolean indicating successful data collection
     """
+    global peak_temperatures
+
     try:
-        nvidia_info = get_nvidia_info()
-        
-        # Get GPU info in CSV format for easier parsing
-        gpu_info = subprocess.run([
-            'nvidia-smi', 
-            '--query-gpu=index,name,fan.speed,power.draw,memory.total,memory.used,utilization.gpu,temperature.gpu,compute_mode,power.limit',
-            '--format=csv,noheader,nounits'
-        ], capture_output=True, text=True)
-        
-        # Print debug information
-        print("GPU info command output:", gpu_info.stdout)
-        print("GPU info command error:", gpu_info.stderr)
-        
-        # Get ALL process info (both compute and graphics)
-        process_info = subprocess.run([
-            'nvidia-smi', 
-            '--query-process=gpu_uuid,pid,used_memory,name',  # Changed to --query-process
-            '--format=csv,noheader,nounits'
-        ], capture_output=True, text=True)
-        
-        print("Process info command output:", process_info.stdout)
-        print("Process info command error:", process_info.stderr)
-
-        gpus = []
-        current_time = datetime.now().timestamp()
-        
-        # Only try to parse if we have output
-        if gpu_info.stdout.strip():
-            for line in gpu_info.stdout.strip().split('\n'):
-                values = [v.strip() for v in line.split(',')]
-                print(f"Parsing GPU line: {line}")
-                print(f"Split values: {values}")
-                if len(values) >= 10:
-                    gpu_index = int(values[0])
-                    temperature = float(values[7])
-                    
-                    # Initialize history for new GPUs
-                    if gpu_index not in temperature_history:
-                        temperature_history[gpu_index] = deque(maxlen=40)  # Store 10 seconds of data at 250ms intervals
-                    
-                    # Update temperature history
-                    temperature_history[gpu_index].append((current_time, temperature))
-                    
-                    # Update peak temperature
-                    if gpu_index not in peak_temperatures or temperature > peak_temperatures[gpu_index]:
-                        peak_temperatures[gpu_index] = temperature
-                    
-                    # Calculate temperature change rate using last 10 seconds
-                    temp_history = temperature_history[gpu_index]
-                    temp_change_rate = 0
-                    if len(temp_history) >= 2:
-                        # Use the most recent measurements for rate calculation
-                        recent_time = temp_history[-1][0] - 10  # Look back 10 seconds
-                        start_temp = None
-                        
-                        # Find the oldest temperature within our 10-second window
-                        for t, temp in temp_history:
-                            if t >= recent_time:
-                                start_temp = temp
-                                break
-                        
-                        if start_temp is not None:
-                            temp_diff = round(temp_history[-1][1]) - round(start_temp)  # Round both temperatures
-                            time_diff = temp_history[-1][0] - recent_time
-                            if time_diff > 0:  # Avoid division by zero
-                                temp_change_rate = (temp_diff / time_diff) * 60  # Convert to per minute
-                                # Only show rate if we have at least a 1 degree change
-                                if abs(temp_diff) < 1:
-                                    temp_change_rate = 0
-                    
-                    gpu_data = {
-                        'index': gpu_index,
-                        'name': values[1].strip(),
-                        'fan_speed': float(values[2]),
-                        'power_draw': float(values[3]),
-                        'power_limit': float(values[9]),
-                        'memory_total': float(values[4]),
-                        'memory_used': float(values[5]),
-                        'gpu_utilization': float(values[6]),
-                        'temperature': temperature,
-                        'peak_temperature': peak_temperatures[gpu_index],
-                        'temp_change_rate': round(temp_change_rate, 2),
-                        'compute_mode': values[8]
-                    }
-                    gpus.append(gpu_data)
-
-        # Parse processes with enhanced gpu-burn detection
-        processes = []
-        gpu_burn_detected = False
-        process_lines = process_info.stdout.strip().split('\n')
-        if process_lines and 'pid' in process_lines[0].lower():
-            process_lines = process_lines[1:]
-        
-        for line in process_lines:
-            if line:  # Skip empty lines
-                values = [v.strip() for v in line.split(',')]
-                if len(values) >= 4:
-                    process_name = values[3].lower()
-                    if 'gpu-burn' in process_name:
-                        gpu_burn_detected = True
-                        if gpu_burn_metrics['start_time'] is None:
-                            gpu_burn_metrics['start_time'] = current_time
-                    
-                    # Include all processes without filtering
-                    process = {
-                        'gpu_uuid': values[0],
-                        'pid': int(values[1]),
-                        'used_memory': float(values[2]),
-                        'name': values[3]
-                    }
-                    processes.append(process)
+        if nvml_init_error is None:
+            nvidia_info = get_nvidia_info()
+            gpus, processes = read_nvml_devices()
+        else:
+            nvidia_info, gpus, processes = read_smi_fallback()
+
+        # Monotonic clock: only used for deltas (rate window, gpu-burn duration),
+        # which must not jump when the wall clock is adjusted
+        current_time = time.monotonic()
+
+        # Update peak temperatures for all GPUs in one vectorized pass
+        current_temps = np.array([gpu_data['temperature'] for gpu_data in gpus], dtype=np.float64)
+        if len(peak_temperatures) != len(current_temps):
+            peak_temperatures = np.full(len(current_temps), -np.inf)
+        np.maximum(peak_temperatures, current_temps, out=peak_temperatures)
+
+        for gpu_data in gpus:
+            gpu_index = gpu_data['index']
+            temperature = gpu_data['temperature']
+
+            # Initialize history for new GPUs
+            if gpu_index not in temperature_history:
+                temperature_history[gpu_index] = TempRing(capacity=40)  # Store 10 seconds of data at 250ms intervals
+
+            # Update temperature history
+            temperature_history[gpu_index].append(current_time, temperature)
+
+            # Calculate temperature change rate using last 10 seconds
+            temp_history = temperature_history[gpu_index]
+            recent_time = current_time - 10  # Look back 10 seconds
+
+            # Samples are stored in time order, so dropping those older than the
+            # window leaves the oldest temperature within our 10-second window
+            temp_history.drop_before(recent_time)
+
+            temp_change_rate = 0
+            if len(temp_history) >= 2:
+                temp_diff = round(temp_history.newest()) - round(temp_history.oldest())  # Round both temperatures
+                # Only show rate if we have at least a 1 degree change
+                if abs(temp_diff) >= 1:
+                    temp_change_rate = (temp_diff / 10) * 60  # Convert to per minute
+
+            gpu_data['peak_temperature'] = float(peak_temperatures[gpu_index])
+            gpu_data['temp_change_rate'] = round(temp_change_rate, 2)
+
+        # Enhanced gpu-burn detection over all compute processes; stops at the
+        # first match and needs no lowercased copy of each process name
+        gpu_burn_detected = any(GPU_BURN_RE.search(process['name']) for process in processes)
+        if gpu_burn_detected and gpu_burn_metrics['start_time'] is None:
+            gpu_burn_metrics['start_time'] = current_time
 
         # Update gpu-burn metrics
         if gpu_burn_detected and gpu_burn_metrics['start_time'] is not None:
@@ -262,6 +709,9 @@ def parse_gpu_info():
             gpu_burn_metrics['start_time'] = None
             gpu_burn_metrics['total_time'] = 0
 
+        # Lazy %-formatting: nothing is formatted unless debug logging is enabled
+        logger.debug("Collected %d GPUs and %d compute processes", len(gpus), len(processes))
+
         return {
             'nvidia_info': nvidia_info,
             'gpus': gpus,
@@ -274,18 +724,67 @@ def parse_gpu_info():
             'success': True
         }
     except Exception as e:
+        logger.debug("Error collecting GPU info", exc_info=True)
         return {
             'success': False,
             'error': str(e)
         }
 
+def _publish(snapshot):
+    """
+    Stores a snapshot as the latest one and hands it to every stream subscriber.
+
+    The snapshot dict is never mutated after publication, so request threads
+    can serve it without copying. Each subscriber queue holds a single
+    snapshot; a client that has not consumed the previous one has it
+    replaced, so slow clients always receive the latest data instead of an
+    ever-growing backlog.
+    """
+    global latest_snapshot
+    with snapshot_lock:
+        latest_snapshot = snapshot
+    snapshot_ready.set()
+
+    with stream_lock:
+        subscribers = list(stream_subscribers)
+    for q in subscribers:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put_nowait(snapshot)
+
+def sample_gpus():
+    """
+    Background sampler loop shared by all API clients.
+
+    Collects one snapshot every SAMPLE_INTERVAL seconds. This thread is the
+    only caller of parse_gpu_info(), so the module-level history and peak
+    state is only mutated here (and by reset_peaks() under state_lock), and
+    N connected dashboards cost a single collection instead of N.
+    """
+    while True:
+        with state_lock:
+            snapshot = parse_gpu_info()
+        _publish(snapshot)
+        time.sleep(SAMPLE_INTERVAL)
+
+def _ensure_sampler():
+    """Starts the background sampler thread on first use."""
+    global sampler_thread
+    with stream_lock:
+        if sampler_thread is None:
+            sampler_thread = threading.Thread(target=sample_gpus, name='gpu-sampler', daemon=True)
+            sampler_thread.start()
+
 @app.route('/api/gpu-stats')
 def get_gpu_stats():
     """
     Flask endpoint that returns current GPU statistics.
 
     This endpoint:
-    1. Collects current GPU metrics via parse_gpu_info()
+    1. Returns the latest snapshot collected by the background sampler
+       (waiting briefly for the first one after startup)
     2. Returns the data in JSON format
     3. Handles CORS automatically via flask-cors
 
@@ -297,7 +796,55 @@ def get_gpu_stats():
             - Peak temperatures
             - GPU burn metrics
     """
-    return jsonify(parse_gpu_info())
+    _ensure_sampler()
+    snapshot_ready.wait(timeout=FIRST_SNAPSHOT_TIMEOUT)
+    with snapshot_lock:
+        snapshot = latest_snapshot
+    if snapshot is None:
+        snapshot = {
+            'success': False,
+            'error': 'No GPU data collected yet'
+        }
+    return jsonify(snapshot)
+
+@app.route('/api/gpu-stats/stream')
+def stream_gpu_stats():
+    """
+    Flask endpoint that streams GPU statistics as Server-Sent Events.
+
+    This endpoint:
+    1. Subscribes the client to the shared background sampler
+    2. Emits each snapshot as a `data:` event in the /api/gpu-stats format
+    3. Sends a comment heartbeat every HEARTBEAT_INTERVAL seconds while idle
+    4. Unsubscribes the client when the connection closes
+
+    Returns:
+        Response: text/event-stream of JSON-formatted GPU statistics
+    """
+    _ensure_sampler()
+    q = queue.Queue(maxsize=1)
+    # Start new clients from the latest snapshot rather than an empty screen
+    with snapshot_lock:
+        if latest_snapshot is not None:
+            q.put_nowait(latest_snapshot)
+    with stream_lock:
+        stream_subscribers.add(q)
+
+    def generate():
+        try:
+            while True:
+                try:
+                    snapshot = q.get(timeout=HEARTBEAT_INTERVAL)
+                except queue.Empty:
+                    yield ': heartbeat\n\n'
+                    continue
+                yield f"data: {app.json.dumps(snapshot)}\n\n"
+        finally:
+            with stream_lock:
+                stream_subscribers.discard(q)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/reset-peaks', methods=['POST'])
 def reset_peaks():
@@ -305,7 +852,7 @@ def reset_peaks():
     Flask endpoint that resets peak temperature records and error counts.
 
     This endpoint:
-    1. Clears the peak_temperatures dictionary
+    1. Clears the peak_temperatures array
     2. Resets GPU burn error counter
     3. Returns success confirmation
 
@@ -313,9 +860,11 @@ def reset_peaks():
         Response: JSON confirmation of reset
             - success: True if reset completed
     """
-    peak_temperatures.clear()
-    gpu_burn_metrics['errors_detected'] = 0
+    with state_lock:
+        peak_temperatures.fill(-np.inf)
+        gpu_burn_metrics['errors_detected'] = 0
     return jsonify({'success': True})
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
     app.run(port=5000)
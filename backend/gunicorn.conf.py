@@ -0,0 +1,18 @@
+# Gunicorn settings for the GPU monitoring service
+#
+# Usage (from the backend directory):
+#     gunicorn -c gunicorn.conf.py gpu_service:app
+
+bind = '127.0.0.1:5000'
+
+# Temperature history, peak records and the background sampler live in
+# process memory, so everything must be served by a single worker process
+workers = 1
+
+# Threads absorb concurrent API requests; every open /api/gpu-stats/stream
+# client holds one thread for the lifetime of its connection
+worker_class = 'gthread'
+threads = 16
+
+# Reuse TCP connections between a client's consecutive requests
+keepalive = 5
@@ -135,25 +135,37 @@ function App() {
   }, [pollingInterval])
 
   useEffect(() => {
-    const fetchData = async () => {
-      const startTime = Date.now();
-      console.log('Fetching GPU stats at:', new Date(startTime).toLocaleTimeString());
-      try {
-        const response = await fetch('http://localhost:5000/api/gpu-stats')
-        if (!response.ok) {
-          throw new Error(`HTTP error! Status: ${response.status}`);
-        }
-        const jsonData = await response.json()
-        console.log('Response received at:', new Date().toLocaleTimeString(), 'Duration:', Date.now() - startTime, 'ms');
+    // The backend samples once and pushes every snapshot over SSE; the selected
+    // polling interval only throttles how often the UI re-renders
+    let latest: GPUData | null = null
+    let received = false
+    const source = new EventSource('http://localhost:5000/api/gpu-stats/stream')
+
+    source.onmessage = (event) => {
+      const jsonData: GPUData = JSON.parse(event.data)
+      if (!received) {
+        received = true
         setData(jsonData)
-      } catch (error) {
-        console.error('Fetch error:', error);
+      } else {
+        latest = jsonData
       }
     }
+    source.onerror = (error) => {
+      // EventSource reconnects automatically
+      console.error('Stream error:', error);
+    }
+
+    const interval = setInterval(() => {
+      if (latest) {
+        setData(latest)
+        latest = null
+      }
+    }, pollingInterval)
 
-    fetchData()
-    const interval = setInterval(fetchData, pollingInterval)
-    return () => clearInterval(interval)
+    return () => {
+      clearInterval(interval)
+      source.close()
+    }
   }, [pollingInterval])
 
   useEffect(() => {
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import subprocess
-import time
 import tkinter as tk
 from tkinter import ttk
 import threading
@@ -33,7 +32,8 @@ class GPUMonitor:
 
         # Monitoring thread control
         self.monitoring_thread = None
-        self.is_monitoring = False
+        self.stop_event = None
+        self.last_hash = None
 
     def get_gpu_info(self):
         try:
@@ -43,22 +43,25 @@ class GPUMonitor:
         except Exception as e:
             return f"Error retrieving GPU info: {str(e)}"
 
-    def monitor_gpus(self):
-        while self.is_monitoring:
-            try:
-                # Clear previous content
-                self.text_area.delete(1.0, tk.END)
-                
-                # Get and display GPU info
-                gpu_info = self.get_gpu_info()
-                self.text_area.insert(tk.END, gpu_info)
-                
-                # Wait for specified interval
-                interval = float(self.interval_var.get())
-                time.sleep(interval)
-            except Exception as e:
-                self.text_area.insert(tk.END, f"Monitoring error: {str(e)}")
-                break
+    def monitor_gpus(self, interval, stop_event):
+        # Runs in the worker thread: only collect data here, Tk widgets must
+        # be updated from the main loop, so hand the output over via after()
+        while not stop_event.is_set():
+            gpu_info = self.get_gpu_info()
+            self.master.after(0, self.update_text, gpu_info)
+
+            # Wait for specified interval (returns early when stopped)
+            stop_event.wait(interval)
+
+    def update_text(self, gpu_info):
+        # Skip the delete/insert and text re-layout when the output is unchanged
+        output_hash = hash(gpu_info)
+        if output_hash == self.last_hash:
+            return
+        self.last_hash = output_hash
+
+        self.text_area.delete(1.0, tk.END)
+        self.text_area.insert(tk.END, gpu_info)
 
     def start_monitoring(self):
         # Validate interval
@@ -71,8 +74,8 @@ class GPUMonitor:
             return
 
         # Start monitoring
-        self.is_monitoring = True
-        self.monitoring_thread = threading.Thread(target=self.monitor_gpus, daemon=True)
+        self.stop_event = threading.Event()
+        self.monitoring_thread = threading.Thread(target=self.monitor_gpus, args=(interval, self.stop_event), daemon=True)
         self.monitoring_thread.start()
 
         # Update button states
@@ -80,10 +83,11 @@ class GPUMonitor:
         self.stop_button.config(state=tk.NORMAL)
 
     def stop_monitoring(self):
-        # Stop monitoring
-        self.is_monitoring = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join()
+        # Stop monitoring; the worker exits at its next wait. Joining here would
+        # block the main loop that the worker's pending after() calls need
+        if self.stop_event:
+            self.stop_event.set()
+        self.monitoring_thread = None
 
         # Update button states
         self.start_button.config(state=tk.NORMAL)
@@ -25,7 +25,7 @@ sleep 1
 # Start backend
 echo "🚀 Starting backend server..."
 cd backend
-python gpu_service.py &
+gunicorn -c gunicorn.conf.py gpu_service:app &
 BACKEND_PID=$!
 echo "✅ Backend started (PID: $BACKEND_PID)"
 
@@ -36,7 +36,7 @@ stop_service() {
 start_services() {
   echo "Starting backend service..."
   cd backend
-  python gpu_service.py &
+  gunicorn -c gunicorn.conf.py gpu_service:app &
   BACKEND_PID=$!
   echo "Backend started (PID: $BACKEND_PID)"
 
@@ -71,7 +71,7 @@ start_services() {
 
 # Main script to restart services
 restart_services() {
-  stop_service 5000 'flask'
+  stop_service 5000 'gpu_service'
   stop_service 3000 'vite'
   start_services
 }